@@ -1,11 +1,28 @@
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from PIL import Image, ImageDraw, ImageTk
+import numpy as np
+import gc
 import os
 import json
+import queue
+import threading
 import xml.etree.ElementTree as ET
 
-# --- Core Image Processing Functions (No Changes Here) ---
+try:
+    import orjson # Optional: faster JSON parsing
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# --- Core Image Processing Functions ---
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+LABEL_EXTENSIONS = ('.json', '.xml', '.txt') # In order of preference when several exist
+PYRAMID_MIN_SIDE = 256 # Smallest short side worth keeping a precomputed zoom level for
 
 def load_yolo_classes(classes_file_path):
     """Loads class names from a .txt or .names file."""
@@ -18,6 +35,35 @@ def load_yolo_classes(classes_file_path):
             print(f"Error loading classes file {classes_file_path}: {e}")
     return class_names
 
+def index_label_files(labels_dir):
+    """
+    Scans labels_dir once and maps each base name to its annotation file path.
+    When a base name has several label files, the earliest in LABEL_EXTENSIONS wins.
+    """
+    label_index = {}
+    with os.scandir(labels_dir) as entries:
+        for entry in entries:
+            base_name, ext = os.path.splitext(entry.name)
+            ext = ext.lower()
+            if ext not in LABEL_EXTENSIONS:
+                continue
+            current = label_index.get(base_name)
+            if current is None or LABEL_EXTENSIONS.index(ext) < LABEL_EXTENSIONS.index(os.path.splitext(current)[1].lower()):
+                label_index[base_name] = entry.path
+    return label_index
+
+def iter_image_label_pairs(image_paths, label_index):
+    """Yields (image path, label path) for every image that has a label file in label_index."""
+    for img_path in image_paths:
+        label_path = label_index.get(os.path.splitext(os.path.basename(img_path))[0])
+        if label_path:
+            yield img_path, label_path
+
+def get_image_size(image_path):
+    """Returns (width, height) from the image header without decoding the pixels."""
+    with Image.open(image_path) as img:
+        return img.size
+
 def parse_annotations(annotation_path, image_width, image_height, class_names=None):
     """
     Parses annotations from JSON (custom), XML (COCO-like), or TXT (YOLO) files.
@@ -28,8 +74,8 @@ def parse_annotations(annotation_path, image_width, image_height, class_names=No
 
     try:
         if file_extension == '.json':
-            with open(annotation_path, 'r') as f:
-                annotations_data = json.load(f)
+            with open(annotation_path, 'rb') as f:
+                annotations_data = _json_loads(f.read())
 
             if annotations_data and isinstance(annotations_data, list) and 'annotations' in annotations_data[0]:
                 for anno in annotations_data[0]['annotations']:
@@ -52,11 +98,20 @@ def parse_annotations(annotation_path, image_width, image_height, class_names=No
                 print(f"Warning: JSON structure not as expected for {annotation_path}. 'annotations' key not found in the first object.")
 
         elif file_extension == '.xml':
-            tree = ET.parse(annotation_path)
-            root = tree.getroot()
-            for obj in root.findall('object'):
-                label = obj.find('name').text if obj.find('name') is not None else 'No Label'
-                bndbox = obj.find('bndbox')
+            # Stream the file and free each <object> once handled, so memory stays bounded.
+            # Depth tracking limits matches to direct children of the root, like root.findall('object').
+            elem = None
+            depth = 0
+            for event, elem in ET.iterparse(annotation_path, events=("start", "end")):
+                if event == "start":
+                    depth += 1
+                    continue
+                depth -= 1
+                if depth != 1 or elem.tag != 'object':
+                    continue
+                name = elem.find('name')
+                label = name.text if name is not None else 'No Label'
+                bndbox = elem.find('bndbox')
                 if bndbox is not None:
                     x_min = int(float(bndbox.find('xmin').text))
                     y_min = int(float(bndbox.find('ymin').text))
@@ -69,35 +124,19 @@ def parse_annotations(annotation_path, image_width, image_height, class_names=No
                         'x_max': x_max,
                         'y_max': y_max
                     })
+                elem.clear()
+            if elem is not None:
+                elem.clear() # The last "end" event is the root element
 
         elif file_extension == '.txt': # YOLO format: class_id x_center y_center width height (normalized)
             if not class_names:
                 print(f"Warning: No class names provided for YOLO .txt file: {annotation_path}. Labels will be class IDs.")
-            with open(annotation_path, 'r') as f:
-                for line in f:
-                    parts = line.strip().split()
-                    if len(parts) == 5:
-                        class_id = int(parts[0])
-                        x_center_norm, y_center_norm, width_norm, height_norm = map(float, parts[1:])
-
-                        x_center = x_center_norm * image_width
-                        y_center = y_center_norm * image_height
-                        bbox_width = width_norm * image_width
-                        bbox_height = height_norm * image_height
-
-                        x_min = int(x_center - bbox_width / 2)
-                        y_min = int(y_center - bbox_height / 2)
-                        x_max = int(x_center + bbox_width / 2)
-                        y_max = int(y_center + bbox_height / 2)
-
-                        label = class_names[class_id] if class_names and class_id < len(class_names) else f"Class {class_id}"
-                        annotations.append({
-                            'label': label,
-                            'x_min': x_min,
-                            'y_min': y_min,
-                            'x_max': x_max,
-                            'y_max': y_max
-                        })
+            try:
+                annotations = _parse_yolo_txt(annotation_path, image_width, image_height, class_names)
+            except ValueError:
+                # Ragged or malformed rows: fall back to the line-by-line parser. It appends into
+                # `annotations` as it goes, so boxes before a bad value survive the error below.
+                _parse_yolo_txt_lines(annotation_path, image_width, image_height, class_names, annotations)
         else:
             print(f"Unsupported annotation file format: {file_extension} for {annotation_path}")
 
@@ -110,27 +149,101 @@ def parse_annotations(annotation_path, image_width, image_height, class_names=No
 
     return annotations
 
-def draw_bounding_boxes(image_path, annotations, draw_on_copy=True):
+def _yolo_label(class_id, class_names):
+    return class_names[class_id] if class_names and class_id < len(class_names) else f"Class {class_id}"
+
+def _parse_yolo_txt(annotation_path, image_width, image_height, class_names):
+    """Vectorized YOLO parser. Raises ValueError if the file is not a clean N x 5 table."""
+    with open(annotation_path, 'r') as f:
+        lines = f.read().splitlines()
+    # An empty label file (no objects) is valid; check here since loadtxt would warn about it
+    if not any(line.strip() for line in lines):
+        return []
+    # Class ids are parsed as integers so '0.0' or '1.7' is rejected the way int() rejects it, and
+    # comments=None so '#' lines reach the line-by-line parser, which treats them as the baseline did
+    table = np.loadtxt(lines, dtype=[('class_id', np.int64), ('box', np.float64, (4,))], ndmin=1, comments=None)
+    arr = table['box']
+    # NaN/inf coordinates cannot be converted to pixels; int() in the line-by-line parser reports them
+    if not np.isfinite(arr).all():
+        raise ValueError("non-finite value in YOLO label file")
+
+    class_ids = table['class_id'].tolist()
+    x_center, y_center = arr[:, 0] * image_width, arr[:, 1] * image_height
+    half_w, half_h = arr[:, 2] * image_width / 2, arr[:, 3] * image_height / 2
+
+    x_min = (x_center - half_w).astype(np.int64).tolist()
+    y_min = (y_center - half_h).astype(np.int64).tolist()
+    x_max = (x_center + half_w).astype(np.int64).tolist()
+    y_max = (y_center + half_h).astype(np.int64).tolist()
+
+    return [
+        {'label': _yolo_label(c, class_names), 'x_min': x0, 'y_min': y0, 'x_max': x1, 'y_max': y1}
+        for c, x0, y0, x1, y1 in zip(class_ids, x_min, y_min, x_max, y_max)
+    ]
+
+def _parse_yolo_txt_lines(annotation_path, image_width, image_height, class_names, annotations):
+    """
+    Line-by-line YOLO parser; skips lines that do not have exactly 5 fields.
+    Boxes are appended to `annotations`, so those parsed before a non-numeric value are kept.
+    """
+    with open(annotation_path, 'r') as f:
+        for line in f:
+            parts = line.strip().split()
+            if len(parts) == 5:
+                class_id = int(parts[0])
+                x_center_norm, y_center_norm, width_norm, height_norm = map(float, parts[1:])
+
+                x_center = x_center_norm * image_width
+                y_center = y_center_norm * image_height
+                bbox_width = width_norm * image_width
+                bbox_height = height_norm * image_height
+
+                x_min = int(x_center - bbox_width / 2)
+                y_min = int(y_center - bbox_height / 2)
+                x_max = int(x_center + bbox_width / 2)
+                y_max = int(y_center + bbox_height / 2)
+
+                annotations.append({
+                    'label': _yolo_label(class_id, class_names),
+                    'x_min': x_min,
+                    'y_min': y_min,
+                    'x_max': x_max,
+                    'y_max': y_max
+                })
+
+def draw_bounding_boxes(image, annotations, draw_on_copy=True):
     """
     Draws bounding boxes on an image based on parsed annotations.
+    `image` is either a file path or an already opened PIL Image. A passed-in RGB image is
+    only copied when draw_on_copy is True; otherwise the boxes are drawn onto it in place.
     Returns the PIL Image object.
     """
     try:
-        original_image = Image.open(image_path).convert("RGB")
-        image_to_draw = original_image.copy() if draw_on_copy else original_image
+        if not isinstance(image, Image.Image):
+            with Image.open(image) as img:
+                image_to_draw = img.convert("RGB") # Freshly decoded, nothing to protect
+        elif image.mode != "RGB":
+            image_to_draw = image.convert("RGB") # convert() already returns a new image
+        else:
+            image_to_draw = image.copy() if draw_on_copy else image
         draw = ImageDraw.Draw(image_to_draw)
+        color_cache = {} # label -> box color, so each distinct label is classified once
 
         for annotation in annotations:
             label = annotation.get('label', 'No Label')
             x_min, y_min, x_max, y_max = annotation.get('x_min'), annotation.get('y_min'), annotation.get('x_max'), annotation.get('y_max')
 
             if all(v is not None for v in [x_min, y_min, x_max, y_max]):
-                if "silver marking" in label.lower():
-                    box_color = "yellow"
-                elif "balancing weight" in label.lower():
-                    box_color = "cyan"
-                else:
-                    box_color = "red" 
+                box_color = color_cache.get(label)
+                if box_color is None:
+                    label_lower = label.lower()
+                    if "silver marking" in label_lower:
+                        box_color = "yellow"
+                    elif "balancing weight" in label_lower:
+                        box_color = "cyan"
+                    else:
+                        box_color = "red"
+                    color_cache[label] = box_color
 
                 draw.rectangle([x_min, y_min, x_max, y_max], outline=box_color, width=3)
                 text_position = (x_min, y_min - 20 if y_min - 20 > 0 else y_min + 5)
@@ -145,9 +258,50 @@ def draw_bounding_boxes(image_path, annotations, draw_on_copy=True):
         print(f"An unexpected error occurred during drawing: {e}")
         return None
 
+def _load_pair(img_path, label_path, class_names, annotations=None):
+    """
+    Opens img_path once, parses label_path against its size (unless annotations are given)
+    and returns the RGB image with the boxes drawn onto it.
+    """
+    # load() decodes and releases the file; convert() only when needed, since on an RGB image it copies
+    rgb_image = Image.open(img_path)
+    try:
+        rgb_image.load()
+        if rgb_image.mode != "RGB":
+            converted = rgb_image.convert("RGB")
+            rgb_image.close()
+            rgb_image = converted
+    except Exception:
+        rgb_image.close()
+        raise
+    if annotations is None:
+        img_width, img_height = rgb_image.size
+        annotations = parse_annotations(label_path, img_width, img_height, class_names)
+    return draw_bounding_boxes(rgb_image, annotations, draw_on_copy=False)
+
+def build_pyramid(image):
+    """
+    Returns [image, image / 2, image / 4, ...] down to PYRAMID_MIN_SIDE, so fit-to-canvas zooms
+    resample from far fewer pixels. The levels cost about a third of the image's memory on top.
+    """
+    levels = [image]
+    while min(levels[-1].size) // 2 >= PYRAMID_MIN_SIDE:
+        levels.append(levels[-1].reduce(2))
+    return levels
+
 # --- Tkinter GUI Application ---
 
 class BoundingBoxViewerApp:
+    # Limits for the per-zoom PhotoImage cache (Tk keeps roughly 4 bytes per displayed pixel)
+    PHOTO_CACHE_MAX_ENTRIES = 8
+    PHOTO_CACHE_MAX_PIXELS = 32_000_000
+    # Pairs handed from the folder-scan thread to the Tk thread per callback
+    SCAN_BATCH_SIZE = 256
+    # How often the Tk thread drains results posted by the folder-scan thread
+    SCAN_POLL_MS = 50
+    # Force a garbage collection after this many image switches to keep long sessions' memory flat
+    GC_EVERY_N_IMAGES = 20
+
     def __init__(self, root):
         self.root = root
         self.root.title("Visual Inspection Tool")
@@ -159,16 +313,31 @@ class BoundingBoxViewerApp:
 
         self.original_image_pil = None
         self.current_photo_image = None
+        # LRU of resampled images for visited zoom levels: (disp_w, disp_h) -> (PhotoImage, is_lanczos)
+        self._photo_cache = OrderedDict()
+        self._displayed_size = None # (disp_w, disp_h) of the image currently on the canvas
+        self._refine_after_id = None # Pending LANCZOS refinement of the cached image
+        self._pyramid = [] # original_image_pil followed by successive 2x reductions
+        self._images_shown = 0
         self.zoom_level = 1.0
         # NEW: State variables for stable centered zooming
         self.image_x_offset = 0
         self.image_y_offset = 0
 
-        self.image_files_for_auto = []
+        self.image_files_for_auto = [] # (image path, label path) pairs
+        self.class_names = [] # YOLO class names shared by all automated pairs
+        self._scan_id = 0 # Bumped per folder scan so results from an older scan are ignored
+        # The scan thread never calls Tk itself; it queues (callback, args) for the Tk thread to run
+        self._scan_queue = queue.Queue()
+        self._scan_thread = None
+        self._scan_polling = False
+        self._anno_cache = {} # index into image_files_for_auto -> parsed annotations
         self.current_image_index = 0
+        # Background loading of the neighbouring automated images: index -> Future
+        self._prefetch = {}
+        self._pool = ThreadPoolExecutor(max_workers=2)
 
         self.drawings_on_canvas = []
-        self.last_draw_x, self.last_draw_y = None, None
         self.drawing_active = False
 
         self.current_mode = "pan"
@@ -179,6 +348,7 @@ class BoundingBoxViewerApp:
         self.style.configure('Inactive.TButton', background='lightgray', foreground='black')
         
         self._after_id = None # For debouncing resize events
+        self._zoom_after_id = None # For debouncing wheel zoom redraws
 
         self.create_widgets()
         self.setup_canvas_bindings()
@@ -311,30 +481,44 @@ class BoundingBoxViewerApp:
         file_path = filedialog.askopenfilename(filetypes=filetypes)
         if file_path:
             var.set(file_path)
-            self.drawings_on_canvas.clear()
+            self._clear_drawings()
 
     def browse_auto_folder(self):
         folder_path = filedialog.askdirectory()
         if folder_path:
             self.auto_folder_path.set(folder_path)
-            self.drawings_on_canvas.clear()
+            self._clear_drawings()
 
-    def display_image_on_canvas(self, pil_image):
+    def display_image_on_canvas(self, pil_image, pyramid=None):
+        """Shows pil_image; pass the levels from build_pyramid when they were already built off the Tk thread."""
         if pil_image:
+            # Release the previous image's pixel buffers now rather than whenever they get collected
+            for level in self._pyramid:
+                if level is not pil_image:
+                    level.close()
+            self._images_shown += 1
+            if self._images_shown % self.GC_EVERY_N_IMAGES == 0:
+                gc.collect()
             self.original_image_pil = pil_image
+            self._photo_cache.clear()
+            self._displayed_size = None
+            self._pyramid = pyramid or build_pyramid(pil_image)
             self.fit_image_to_canvas()
 
     # REWRITTEN: Handles stable zooming, centering, and aspect ratio
     def redraw_canvas(self):
         if not self.original_image_pil:
             self.canvas.delete("all")
+            for _, _, options, _ in self.drawings_on_canvas:
+                options["canvas_id"] = None
             return
 
         canvas_w, canvas_h = self.canvas.winfo_width(), self.canvas.winfo_height()
         img_w, img_h = self.original_image_pil.size
 
-        disp_w = int(img_w * self.zoom_level)
-        disp_h = int(img_h * self.zoom_level)
+        # Rounded so zooming out and back in lands on the same size (and cache entry) despite float drift
+        disp_w = int(round(img_w * self.zoom_level))
+        disp_h = int(round(img_h * self.zoom_level))
 
         self.canvas.config(scrollregion=(0, 0, max(disp_w, canvas_w), max(disp_h, canvas_h)))
 
@@ -342,18 +526,71 @@ class BoundingBoxViewerApp:
         self.image_y_offset = max(0, (canvas_h - disp_h) / 2)
 
         if disp_w > 0 and disp_h > 0:
-            resized_image = self.original_image_pil.resize((disp_w, disp_h), Image.Resampling.LANCZOS)
-            self.current_photo_image = ImageTk.PhotoImage(resized_image)
-
-            self.canvas.delete("all")
-            self.canvas.create_image(self.image_x_offset, self.image_y_offset, anchor="nw", image=self.current_photo_image)
-
-            for coords, dtype, options in self.drawings_on_canvas:
+            size = (disp_w, disp_h)
+            self._displayed_size = size
+            cached = self._photo_cache.get(size)
+            if cached is not None:
+                self._photo_cache.move_to_end(size)
+                self.current_photo_image, is_lanczos = cached
+            else:
+                # Fast BILINEAR pass while interacting; LANCZOS once the zoom settles
+                resized_image = self._resample_source(disp_w, disp_h).resize(size, Image.Resampling.BILINEAR)
+                self.current_photo_image = ImageTk.PhotoImage(resized_image)
+                is_lanczos = False
+                self._cache_photo(size, self.current_photo_image, is_lanczos)
+            if not is_lanczos:
+                if self._refine_after_id:
+                    self.root.after_cancel(self._refine_after_id)
+                self._refine_after_id = self.root.after(150, self._refine_resample)
+
+            # Only the image item is recreated; stroke items persist and just get new coordinates
+            self.canvas.delete("img")
+            self.canvas.create_image(self.image_x_offset, self.image_y_offset, anchor="nw", image=self.current_photo_image, tags="img")
+            self.canvas.tag_lower("img")
+
+            for coords, dtype, options, _ in self.drawings_on_canvas:
                 scaled_coords = [c * self.zoom_level for c in coords]
                 offset_coords = [scaled_coords[i] + (self.image_x_offset if i % 2 == 0 else self.image_y_offset) for i in range(len(scaled_coords))]
                 if dtype == "line":
-                    self.canvas.create_line(offset_coords, **{k:v for k,v in options.items() if k != 'canvas_id'})
+                    if options.get("canvas_id") is None:
+                        options["canvas_id"] = self.canvas.create_line(offset_coords, **{k:v for k,v in options.items() if k != 'canvas_id'})
+                    else:
+                        self.canvas.coords(options["canvas_id"], *offset_coords)
     
+    def _resample_source(self, disp_w, disp_h):
+        """
+        Returns the smallest pyramid level that is still at least disp_w x disp_h.
+        Targets well below the smallest level are box-reduced first so LANCZOS/BILINEAR only see a small input.
+        """
+        source = next((level for level in reversed(self._pyramid) if level.size[0] >= disp_w and level.size[1] >= disp_h), self.original_image_pil)
+        factor = min(source.size[0] // disp_w, source.size[1] // disp_h)
+        if factor >= 2:
+            source = source.reduce(factor)
+        return source
+
+    def _cache_photo(self, size, photo, is_lanczos):
+        """Stores `photo` as the most recent entry, evicting the oldest beyond the count/pixel limits."""
+        self._photo_cache[size] = (photo, is_lanczos)
+        self._photo_cache.move_to_end(size)
+        while len(self._photo_cache) > 1 and (
+            len(self._photo_cache) > self.PHOTO_CACHE_MAX_ENTRIES
+            or sum(w * h for w, h in self._photo_cache) > self.PHOTO_CACHE_MAX_PIXELS
+        ):
+            self._photo_cache.popitem(last=False)
+
+    def _refine_resample(self):
+        """Replaces the displayed BILINEAR image with a LANCZOS one at the same size."""
+        self._refine_after_id = None
+        size = self._displayed_size
+        if not self.original_image_pil or size is None: return
+        cached = self._photo_cache.get(size)
+        if cached is not None and cached[1]: return
+
+        resized_image = self._resample_source(*size).resize(size, Image.Resampling.LANCZOS)
+        self.current_photo_image = ImageTk.PhotoImage(resized_image)
+        self._cache_photo(size, self.current_photo_image, True)
+        self.canvas.itemconfig("img", image=self.current_photo_image)
+
     # NEW: Calculates the best zoom level to fit the image and calls redraw
     def fit_image_to_canvas(self):
         if not self.original_image_pil: return
@@ -413,9 +650,16 @@ class BoundingBoxViewerApp:
         # Apply the zoom
         self.canvas.scale("all", x, y, zoom_factor, zoom_factor)
         self.zoom_level *= zoom_factor
-        self.redraw_canvas() # Redraw to recenter if needed and fix scrollregion
+        # canvas.scale already gives cheap feedback; coalesce a burst of wheel ticks into one redraw
+        if self._zoom_after_id:
+            self.root.after_cancel(self._zoom_after_id)
+        self._zoom_after_id = self.root.after(60, self._redraw_after_zoom)
         self.status_bar.config(text=f"Zoom: {self.zoom_level:.2f}x")
 
+    def _redraw_after_zoom(self):
+        self._zoom_after_id = None
+        self.redraw_canvas() # Redraw to recenter if needed and fix scrollregion
+
     def _canvas_to_image_coords(self, canvas_x, canvas_y):
         """Converts canvas coordinates to original image coordinates."""
         img_x = (self.canvas.canvasx(canvas_x) - self.image_x_offset) / self.zoom_level
@@ -425,27 +669,29 @@ class BoundingBoxViewerApp:
     def start_draw(self, event):
         if self.original_image_pil is None: return
         self.drawing_active = True
-        self.last_draw_x, self.last_draw_y = self._canvas_to_image_coords(event.x, event.y)
-        self.current_drawing_coords_unscaled = [self.last_draw_x, self.last_draw_y]
+        self.current_drawing_coords_unscaled = list(self._canvas_to_image_coords(event.x, event.y))
         
     def do_draw(self, event):
         if not self.drawing_active: return
+        # Store image-space points as they arrive, so a zoom or refit mid-stroke cannot shift the stroke
+        last_x, last_y = self.current_drawing_coords_unscaled[-2:]
         x, y = self._canvas_to_image_coords(event.x, event.y)
         self.current_drawing_coords_unscaled.extend([x, y])
         
-        # Create a temporary line on the canvas for visual feedback
-        self.redraw_canvas() # Redraw base image
-        # Draw the line currently being drawn
-        scaled_coords = [c * self.zoom_level for c in self.current_drawing_coords_unscaled]
-        offset_coords = [scaled_coords[i] + (self.image_x_offset if i % 2 == 0 else self.image_y_offset) for i in range(len(scaled_coords))]
-        self.canvas.create_line(offset_coords, fill="cyan", width=2, tags="temp_drawing")
-        self.last_draw_x, self.last_draw_y = x, y
+        # Append just the new segment; the base image and earlier segments are untouched
+        segment = [
+            last_x * self.zoom_level + self.image_x_offset, last_y * self.zoom_level + self.image_y_offset,
+            x * self.zoom_level + self.image_x_offset, y * self.zoom_level + self.image_y_offset,
+        ]
+        self.canvas.create_line(segment, fill="cyan", width=2, capstyle=tk.ROUND, tags="temp_drawing")
 
     def end_draw(self, event):
         if not self.drawing_active: return
         self.canvas.delete("temp_drawing")
+        image_coords = list(self.current_drawing_coords_unscaled)
+        # Entries are (flat coords, type, canvas options + "canvas_id", (n, 2) point array used for erase hit-testing)
         self.drawings_on_canvas.append(
-            (list(self.current_drawing_coords_unscaled), "line", {"fill": "blue", "width": 2})
+            (image_coords, "line", {"fill": "blue", "width": 2, "canvas_id": None}, np.asarray(image_coords, dtype=np.float32).reshape(-1, 2))
         )
         self.drawing_active = False
         self.redraw_canvas()
@@ -456,17 +702,26 @@ class BoundingBoxViewerApp:
         
         # Find drawings close to the cursor on the original image scale
         tolerance = 5 / self.zoom_level # 5 pixel tolerance on screen
-        original_len = len(self.drawings_on_canvas)
-        
-        self.drawings_on_canvas = [
-            drawing for drawing in self.drawings_on_canvas 
-            if not any(
-                abs(drawing[0][i] - erase_x) < tolerance and abs(drawing[0][i+1] - erase_y) < tolerance
-                for i in range(0, len(drawing[0]), 2)
-            )
-        ]
-        if len(self.drawings_on_canvas) < original_len:
-            self.redraw_canvas()
+        erase_point = np.array([erase_x, erase_y], dtype=np.float32)
+        kept = []
+        for drawing in self.drawings_on_canvas:
+            if np.any((np.abs(drawing[3] - erase_point) < tolerance).all(axis=1)):
+                self._delete_drawing_item(drawing)
+            else:
+                kept.append(drawing)
+        self.drawings_on_canvas = kept
+
+    def _delete_drawing_item(self, drawing):
+        canvas_id = drawing[2].get("canvas_id")
+        if canvas_id is not None:
+            self.canvas.delete(canvas_id)
+            drawing[2]["canvas_id"] = None
+
+    def _clear_drawings(self):
+        """Removes all user strokes, including their canvas items."""
+        for drawing in self.drawings_on_canvas:
+            self._delete_drawing_item(drawing)
+        self.drawings_on_canvas.clear()
 
     def process_single_image(self):
         image_p, label_p, classes_p = self.image_path.get(), self.label_path.get(), self.classes_path.get()
@@ -475,15 +730,11 @@ class BoundingBoxViewerApp:
             return
         try:
             self.status_bar.config(text="Processing...")
-            with Image.open(image_p) as img:
-                img_width, img_height = img.size
-            
+            self._cancel_prefetch()
             class_names = load_yolo_classes(classes_p) if classes_p else None
-            annotations = parse_annotations(label_p, img_width, img_height, class_names)
-            
-            annotated_image_pil = draw_bounding_boxes(image_p, annotations)
+            annotated_image_pil = _load_pair(image_p, label_p, class_names)
             if annotated_image_pil:
-                self.drawings_on_canvas.clear()
+                self._clear_drawings()
                 self.display_image_on_canvas(annotated_image_pil)
                 self.status_bar.config(text=f"Successfully processed {os.path.basename(image_p)}")
         except Exception as e:
@@ -503,47 +754,150 @@ class BoundingBoxViewerApp:
         if not os.path.isdir(images_dir) or not os.path.isdir(labels_dir):
             images_dir, labels_dir = root_folder, root_folder
         
-        image_paths = sorted([os.path.join(images_dir, f) for f in os.listdir(images_dir) if f.lower().endswith(('.png', '.jpg', '.jpeg'))])
-        class_names = load_yolo_classes(classes_file)
-        
-        found_pairs = []
-        for img_path in image_paths:
-            base_name = os.path.splitext(os.path.basename(img_path))[0]
-            for ext in ['.json', '.xml', '.txt']:
-                label_path = os.path.join(labels_dir, base_name + ext)
-                if os.path.exists(label_path):
-                    found_pairs.append((img_path, label_path, class_names))
+        self._cancel_prefetch()
+        self.image_files_for_auto = []
+        self._anno_cache = {}
+        self._scan_id += 1
+        # Scan in the background so the window stays responsive on large folders
+        self._scan_thread = threading.Thread(target=self._scan_folder, args=(self._scan_id, images_dir, labels_dir, classes_file), daemon=True)
+        self._scan_thread.start()
+        if not self._scan_polling:
+            self._scan_polling = True
+            self.root.after(self.SCAN_POLL_MS, self._drain_scan_queue)
+
+    def _drain_scan_queue(self):
+        """Tk thread: runs callbacks queued by the scan thread, polling until it has finished."""
+        try:
+            while True:
+                try:
+                    callback, args = self._scan_queue.get_nowait()
+                except queue.Empty:
                     break
-        
-        self.image_files_for_auto = found_pairs
-        if not self.image_files_for_auto:
-            messagebox.showinfo("Info", "No image-label pairs found.")
-            return
+                callback(*args)
+        finally:
+            if self._scan_thread is not None and self._scan_thread.is_alive():
+                self.root.after(self.SCAN_POLL_MS, self._drain_scan_queue)
+            elif not self._scan_queue.empty():
+                self.root.after(0, self._drain_scan_queue)
+            else:
+                self._scan_polling = False
 
-        self.current_image_index = 0
-        for w, state in [(self.prev_button, tk.NORMAL), (self.next_button, tk.NORMAL), (self.nav_entry, tk.NORMAL), (self.nav_button, tk.NORMAL)]:
-            w.config(state=state)
-        self.show_current_automated_image()
+    def _scan_folder(self, scan_id, images_dir, labels_dir, classes_file):
+        """Worker thread: pairs images with labels and hands them to the Tk thread in batches."""
+        try:
+            with os.scandir(images_dir) as entries:
+                image_paths = sorted(entry.path for entry in entries if entry.name.lower().endswith(IMAGE_EXTENSIONS))
+            label_index = index_label_files(labels_dir)
+            # Class names only matter for YOLO labels, so skip reading the classes file otherwise.
+            # Only paired labels count: in the flat layout classes.txt itself is in label_index.
+            needs_classes = any(label_path.lower().endswith('.txt') for _, label_path in iter_image_label_pairs(image_paths, label_index))
+            class_names = load_yolo_classes(classes_file) if needs_classes else []
+
+            found_pairs = []
+            pairs = iter_image_label_pairs(image_paths, label_index)
+            batch = list(islice(pairs, self.SCAN_BATCH_SIZE))
+            while batch:
+                found_pairs.extend(batch)
+                self._scan_queue.put((self._add_scanned_pairs, (scan_id, batch, class_names)))
+                batch = list(islice(pairs, self.SCAN_BATCH_SIZE))
+        except Exception as e:
+            self._scan_queue.put((self._finish_scan, (scan_id, e)))
+            return
+        self._scan_queue.put((self._finish_scan, (scan_id, None)))
+        self._parse_all_annotations(scan_id, found_pairs, class_names)
+
+    def _parse_all_annotations(self, scan_id, pairs, class_names):
+        """Worker thread: parses every pair's labels in parallel so browsing never waits on parsing."""
+        def parse_pair(pair):
+            img_path, label_path = pair
+            try:
+                return parse_annotations(label_path, *get_image_size(img_path), class_names)
+            except Exception:
+                return None # Left uncached; _load_and_draw retries and reports the error
+
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            for start in range(0, len(pairs), self.SCAN_BATCH_SIZE):
+                if scan_id != self._scan_id: return
+                results = list(executor.map(parse_pair, pairs[start:start + self.SCAN_BATCH_SIZE]))
+                self._scan_queue.put((self._store_annotations, (scan_id, start, results)))
+
+    def _store_annotations(self, scan_id, start, results):
+        if scan_id != self._scan_id: return
+        self._anno_cache.update((start + i, annotations) for i, annotations in enumerate(results) if annotations is not None)
+
+    def _add_scanned_pairs(self, scan_id, pairs, class_names):
+        if scan_id != self._scan_id: return
+        first_batch = not self.image_files_for_auto
+        self.class_names = class_names
+        self.image_files_for_auto.extend(pairs)
+        if first_batch:
+            self.current_image_index = 0
+            for w, state in [(self.prev_button, tk.NORMAL), (self.next_button, tk.NORMAL), (self.nav_entry, tk.NORMAL), (self.nav_button, tk.NORMAL)]:
+                w.config(state=state)
+            self.show_current_automated_image()
+        else:
+            self.image_counter_label.config(text=f"{self.current_image_index + 1}/{len(self.image_files_for_auto)}")
+            self._prefetch_neighbours()
+
+    def _finish_scan(self, scan_id, error):
+        if scan_id != self._scan_id: return
+        if error is not None:
+            messagebox.showerror("Error", f"Failed to scan folder: {error}")
+        elif not self.image_files_for_auto:
+            self.status_bar.config(text="Ready")
+            messagebox.showinfo("Info", "No image-label pairs found.")
 
     def show_current_automated_image(self):
         if not self.image_files_for_auto: return
         
-        img_path, label_path, class_names = self.image_files_for_auto[self.current_image_index]
+        img_path, _ = self.image_files_for_auto[self.current_image_index]
         self.status_bar.config(text=f"Loading image {self.current_image_index + 1}/{len(self.image_files_for_auto)}...")
         try:
-            with Image.open(img_path) as img:
-                img_width, img_height = img.size
-            
-            annotations = parse_annotations(label_path, img_width, img_height, class_names)
-            annotated_image_pil = draw_bounding_boxes(img_path, annotations)
-            if annotated_image_pil:
-                self.drawings_on_canvas.clear()
-                self.display_image_on_canvas(annotated_image_pil)
+            future = self._prefetch.pop(self.current_image_index, None)
+            if future is not None:
+                pyramid = future.result()
+            else:
+                pyramid = self._load_and_draw(self.current_image_index)
+            if pyramid:
+                self._clear_drawings()
+                self.display_image_on_canvas(pyramid[0], pyramid)
                 self.image_counter_label.config(text=f"{self.current_image_index + 1}/{len(self.image_files_for_auto)}")
                 self.nav_entry_var.set(str(self.current_image_index + 1))
                 self.status_bar.config(text=f"Viewing {os.path.basename(img_path)}")
         except Exception as e:
             messagebox.showerror("Error", f"Could not load {os.path.basename(img_path)}: {e}")
+        self._prefetch_neighbours()
+
+    def _load_and_draw(self, index):
+        """
+        Loads automated image `index` with its boxes drawn and returns its build_pyramid levels (or None).
+        Safe to run off the Tk thread, which is where prefetches build their zoom levels.
+        """
+        img_path, label_path = self.image_files_for_auto[index]
+        annotated_image_pil = _load_pair(img_path, label_path, self.class_names, self._anno_cache.get(index))
+        return build_pyramid(annotated_image_pil) if annotated_image_pil else None
+
+    def _prefetch_neighbours(self):
+        """Starts loading the previous and next images, dropping prefetches that are no longer adjacent."""
+        wanted = {i for i in (self.current_image_index - 1, self.current_image_index + 1) if 0 <= i < len(self.image_files_for_auto)}
+        for index in list(self._prefetch):
+            if index not in wanted:
+                self._discard_future(self._prefetch.pop(index))
+        for index in wanted:
+            if index not in self._prefetch:
+                self._prefetch[index] = self._pool.submit(self._load_and_draw, index)
+
+    def _cancel_prefetch(self):
+        for future in self._prefetch.values():
+            self._discard_future(future)
+        self._prefetch.clear()
+
+    @staticmethod
+    def _discard_future(future):
+        """Cancels a prefetch, or closes its image levels if it already finished loading."""
+        if not future.cancel() and future.done() and future.exception() is None and future.result() is not None:
+            for level in future.result():
+                level.close()
 
     def show_next_image(self):
         if self.current_image_index < len(self.image_files_for_auto) - 1:
@@ -568,17 +922,39 @@ class BoundingBoxViewerApp:
         if not file_path: return
 
         try:
-            image_to_save = self.original_image_pil.copy()
-            draw = ImageDraw.Draw(image_to_save)
-            for coords, dtype, options in self.drawings_on_canvas:
-                if dtype == "line":
-                    draw.line(coords, fill=options.get("fill", "blue"), width=options.get("width", 2))
-            
-            image_to_save.save(file_path)
+            image = self.original_image_pil
+            lines = [(coords, options, points) for coords, dtype, options, points in self.drawings_on_canvas if dtype == "line"]
+            box = self._drawings_bbox(lines, image.size)
+            if box is None:
+                image.save(file_path)
+            else:
+                # Draw straight onto the displayed image and put back only the region the strokes touched,
+                # rather than duplicating the whole pixel buffer.
+                backup = image.crop(box)
+                try:
+                    draw = ImageDraw.Draw(image)
+                    for coords, options, _ in lines:
+                        draw.line(coords, fill=options.get("fill", "blue"), width=options.get("width", 2))
+                    image.save(file_path)
+                finally:
+                    image.paste(backup, box[:2])
+                    backup.close()
             self.status_bar.config(text=f"Image saved to {os.path.basename(file_path)}")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save image: {e}")
 
+    @staticmethod
+    def _drawings_bbox(lines, image_size):
+        """Returns the (left, top, right, bottom) image region covered by `lines`, or None if it is empty."""
+        if not lines:
+            return None
+        points = np.concatenate([p for _, _, p in lines])
+        pad = max(options.get("width", 2) for _, options, _ in lines) + 1
+        left, top = np.floor(points.min(axis=0)).astype(int) - pad
+        right, bottom = np.ceil(points.max(axis=0)).astype(int) + pad
+        box = (max(0, int(left)), max(0, int(top)), min(image_size[0], int(right)), min(image_size[1], int(bottom)))
+        return box if box[0] < box[2] and box[1] < box[3] else None
+
 if __name__ == "__main__":
     root = tk.Tk()
     app = BoundingBoxViewerApp(root)